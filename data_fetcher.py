@@ -5,9 +5,25 @@ Handles ESPN API integration and extraction of stat leaders for
 basketball (NBA/NCAAM) and football (NFL/NCAAF) games.
 """
 
-from typing import Dict, List, Optional
+import functools
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding when installed
+    orjson = None
+
 
 # ESPN API league mapping
 LEAGUE_MAP = {
@@ -26,6 +42,138 @@ BASKETBALL_STAT_INDICES = {
     'REB': 10,  # Rebounds
     'AST': 11   # Assists
 }
+_BASKETBALL_STAT_ITEMS = tuple(BASKETBALL_STAT_INDICES.items())
+
+# Boxscore basketball stat positions: PTS usually last, REB index 6, AST index 7
+BOXSCORE_BASKETBALL_STAT_INDICES = (
+    ('PTS', -1),
+    ('REB', 6),
+    ('AST', 7)
+)
+
+# Concurrent boxscore fetching (I/O bound, so threads are sufficient)
+BOXSCORE_FETCH_WORKERS = 8
+BOXSCORE_FETCH_TIMEOUT = 10  # seconds to wait on a single boxscore
+
+# Boxscore cache TTLs (seconds) by game state; live play changes fastest
+TTL_BY_STATE = {
+    'in': 20,
+    'halftime': 120,
+    'pre': 600,
+    'post': 3600
+}
+
+# Scoreboard cache TTLs (seconds) depending on whether the last poll saw live games
+SCOREBOARD_TTL_LIVE = 30
+SCOREBOARD_TTL_IDLE = 300
+
+# HTTP timeouts for direct requests: (connect, read) in seconds
+HTTP_TIMEOUT = (3, 10)
+
+# Number of direct-request responses kept for ETag/Last-Modified revalidation
+CONDITIONAL_CACHE_SIZE = 64
+
+
+@dataclass
+class GameInfo:
+    """Live game record with score, clock and stat leaders."""
+
+    id: Optional[str]
+    league: str
+    home_abbr: str
+    away_abbr: str
+    home_score: int
+    away_score: int
+    period: int
+    clock: str
+    period_text: str
+    state: str = 'in'
+    home_leaders: Optional[Dict] = None
+    away_leaders: Optional[Dict] = None
+
+    def as_dict(self) -> Dict:
+        """
+        Return the fields as a plain dictionary.
+
+        Returns:
+            Dictionary keyed by field name
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _abbreviate_name(full_name: str) -> str:
+    """
+    Abbreviate player name for compact display (memoized; names repeat every poll).
+
+    Args:
+        full_name: Full player name (e.g., "Patrick Mahomes")
+
+    Returns:
+        Abbreviated name (e.g., "P. Mahomes" or "Mahomes")
+    """
+    name = full_name.strip()
+    idx = name.rfind(' ')
+
+    if idx < 0:
+        # Single name or unknown - truncate if too long
+        return name[:10] if len(name) > 10 else name
+
+    last = name[idx + 1:]
+    # Use last name only if short enough, otherwise "F. Lastname" format
+    return last if len(last) <= 8 else f"{name[0]}. {last}"
+
+
+def _parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is available.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def _safe_int(value) -> int:
+    """
+    Convert an ESPN stat value to int without raising.
+
+    Checks for digits up front so the common path avoids exception handling.
+
+    Args:
+        value: Stat value, usually a string such as "24", "" or "--"
+
+    Returns:
+        Integer value, or 0 if blank or not a whole number
+    """
+    if not value:
+        return 0
+    if not isinstance(value, str):
+        return value if isinstance(value, int) else 0
+    digits = value[1:] if value[0] == '-' else value
+    return int(value) if digits.isdecimal() else 0
+
+
+def _sections_by_name(stats_section: List[Dict]) -> Dict[str, Dict]:
+    """
+    Index ESPN statistics sections by their 'name' field in one pass.
+
+    Args:
+        stats_section: Competitor 'statistics' list
+
+    Returns:
+        Dictionary of section name -> section (first occurrence wins)
+    """
+    sections = {}
+    for section in stats_section:
+        if isinstance(section, dict):
+            sections.setdefault(section.get('name'), section)
+    return sections
 
 
 class DataFetcher:
@@ -44,7 +192,148 @@ class DataFetcher:
         self.cache_manager = cache_manager
         self.logger = logger
 
-    def fetch_live_games(self, league_key: str, max_games: int = 50) -> List[Dict]:
+        # Skip building per-game debug messages unless DEBUG is enabled;
+        # refreshed on every fetch_live_games call
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Worker pool for per-game boxscore requests
+        self._executor = ThreadPoolExecutor(
+            max_workers=BOXSCORE_FETCH_WORKERS,
+            thread_name_prefix="live-player-stats"
+        )
+
+        # Keep-alive session for requests made outside api_helper (NCAA API)
+        self._session = self._create_session()
+
+        # url -> (etag, last_modified, data) for conditional GETs on direct requests
+        self._conditional_cache: OrderedDict = OrderedDict()
+        self._conditional_lock = threading.Lock()
+
+        # Leagues whose most recent scoreboard poll had live games
+        self._live_leagues = set()
+
+        # Leagues polled at least once, and background boxscore loads started
+        # on a league's first (cold) poll
+        self._polled_leagues = set()
+        self._revalidating: List[Future] = []
+
+        # In-flight requests keyed by cache key, shared by concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session with retries for direct API requests.
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+
+    def _singleflight(self, key: str, fetch: Callable, *args, **kwargs):
+        """
+        Run fetch once per key across concurrent callers.
+
+        The first caller for a key performs the request on its own thread;
+        callers arriving while it is in flight wait on the same Future
+        instead of issuing a duplicate request.
+
+        Args:
+            key: Request identity (the api_helper cache key)
+            fetch: Callable performing the request
+            *args, **kwargs: Passed through to fetch
+
+        Returns:
+            Result of fetch (exceptions propagate to every waiter)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+
+        if not is_owner:
+            return future.result(timeout=BOXSCORE_FETCH_TIMEOUT)
+
+        try:
+            result = fetch(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _get_json(self, url: str):
+        """
+        GET a JSON resource over the pooled session, revalidating with ETags.
+
+        When an earlier response for the URL carried ETag or Last-Modified,
+        those are sent back as If-None-Match / If-Modified-Since; a 304 reply
+        reuses the stored body without downloading or decoding it again.
+
+        Args:
+            url: Resource URL
+
+        Returns:
+            Decoded JSON data
+
+        Raises:
+            requests.RequestException: On connection or HTTP errors
+        """
+        with self._conditional_lock:
+            cached = self._conditional_cache.get(url)
+
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = self._session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if cached and response.status_code == 304:
+            with self._conditional_lock:
+                if url in self._conditional_cache:
+                    self._conditional_cache.move_to_end(url)
+            return cached[2]
+
+        response.raise_for_status()
+        data = _parse_json(response)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._conditional_lock:
+                self._conditional_cache[url] = (etag, last_modified, data)
+                self._conditional_cache.move_to_end(url)
+                while len(self._conditional_cache) > CONDITIONAL_CACHE_SIZE:
+                    self._conditional_cache.popitem(last=False)
+
+        return data
+
+    def close(self):
+        """Shut down background workers and release pooled connections."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def fetch_live_games(self, league_key: str, max_games: int = 50) -> List[GameInfo]:
         """
         Fetch live games for a specific league.
 
@@ -53,8 +342,10 @@ class DataFetcher:
             max_games: Maximum number of games to return
 
         Returns:
-            List of game dictionaries with extracted stats
+            List of GameInfo records with extracted stats
         """
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+
         if league_key not in LEAGUE_MAP:
             self.logger.warning(f"Unknown league: {league_key}")
             return []
@@ -65,56 +356,98 @@ class DataFetcher:
 
         sport, league = LEAGUE_MAP[league_key]
 
+        # Poll quickly while games are live, back off when the slate is idle.
+        # The bucket is part of the cache key so a state change forces a refetch.
+        was_live = league_key in self._live_leagues
+        bucket = 'live' if was_live else 'idle'
+        scoreboard_ttl = SCOREBOARD_TTL_LIVE if was_live else SCOREBOARD_TTL_IDLE
+
         # Create cache key with current date
         date_str = datetime.now().strftime('%Y%m%d')
-        cache_key = f"live_stats_{league_key}_{date_str}"
+        cache_key = f"live_stats_{league_key}_{date_str}_{bucket}"
 
         try:
-            # Fetch scoreboard with 60-second cache for live updates
-            scoreboard = self.api_helper.fetch_espn_scoreboard(
+            scoreboard = self._singleflight(
+                cache_key,
+                self.api_helper.fetch_espn_scoreboard,
                 sport=sport,
                 league=league,
                 cache_key=cache_key,
-                cache_ttl=60
+                cache_ttl=scoreboard_ttl
             )
 
             if not scoreboard or 'events' not in scoreboard:
                 self.logger.debug(f"No scoreboard data for {league_key}")
                 return []
 
-            # Extract live games
-            live_games = []
+            # Collect live games (header info only; boxscores are fetched below)
+            live_events = []
             total_events = len(scoreboard.get('events', []))
-            self.logger.debug(f"Processing {total_events} total events for {league_key}")
+            if self._debug:
+                self.logger.debug(f"Processing {total_events} total events for {league_key}")
 
             for event in scoreboard.get('events', []):
                 # Stop if we've reached max games
-                if len(live_games) >= max_games:
+                if len(live_events) >= max_games:
                     self.logger.info(f"Reached max_games limit ({max_games}) for {league_key}")
                     break
 
                 # Only process games that are live (in progress)
-                status_state = event.get('status', {}).get('type', {}).get('state')
-                status_detail = event.get('status', {}).get('type', {}).get('detail', '')
+                status = event.get('status') or {}
+                status_type = status.get('type') or {}
+                status_state = status_type.get('state')
+                status_detail = status_type.get('detail', '')
 
                 # Log game status for debugging
-                comp = event.get('competitions', [{}])[0]
+                competitions = event.get('competitions')
+                comp = competitions[0] if competitions else {}
                 comps = comp.get('competitors', [])
                 if len(comps) >= 2:
                     away = comps[0].get('team', {}).get('abbreviation', '?')
                     home = comps[1].get('team', {}).get('abbreviation', '?')
                     self.logger.info(f"Game: {away} @ {home}, Status: {status_state} ({status_detail})")
 
-                if status_state != 'in':
+                if status_state != 'in' or len(comps) < 2:
                     continue
 
-                # Parse game event
-                game_info = self._parse_game_event(event, league_key)
-                if game_info:
-                    live_games.append(game_info)
-                    self.logger.info(f"Parsed live game: {game_info.get('away_abbr')} @ {game_info.get('home_abbr')}, "
-                                   f"home_leaders: {bool(game_info.get('home_leaders'))}, "
-                                   f"away_leaders: {bool(game_info.get('away_leaders'))}")
+                parsed = self._parse_live_event_fast(event, league_key, status, status_type, comps)
+                if parsed:
+                    live_events.append(parsed)
+
+            # On a league's first poll, return scoreboard leaders immediately and
+            # load boxscores in the background (stale-while-revalidate)
+            revalidate = league_key not in self._polled_leagues
+            self._polled_leagues.add(league_key)
+
+            # Fetch boxscores concurrently, then consume results in order
+            futures = [
+                self._executor.submit(self._fetch_game_boxscore, game_data.id, league_key,
+                                      game_data.state)
+                if game_data.id and not revalidate else None
+                for game_data, _, _ in live_events
+            ]
+            self._wait_for_boxscores(futures)
+
+            live_games = []
+            for (game_data, home_team, away_team), future in zip(live_events, futures):
+                if revalidate and game_data.id:
+                    self._apply_leaders(game_data, None, home_team, away_team, league_key)
+                    self._revalidating.append(
+                        self._executor.submit(self._load_leaders, game_data, home_team, away_team)
+                    )
+                elif future is not None:
+                    boxscore = self._boxscore_result(future, game_data.id)
+                    self._apply_leaders(game_data, boxscore, home_team, away_team, league_key)
+
+                live_games.append(game_data)
+                self.logger.info(f"Parsed live game: {game_data.away_abbr} @ {game_data.home_abbr}, "
+                               f"home_leaders: {bool(game_data.home_leaders)}, "
+                               f"away_leaders: {bool(game_data.away_leaders)}")
+
+            if live_games:
+                self._live_leagues.add(league_key)
+            else:
+                self._live_leagues.discard(league_key)
 
             self.logger.info(f"Found {len(live_games)} live games in {league_key} (out of {total_events} total, max={max_games})")
             return live_games
@@ -123,79 +456,185 @@ class DataFetcher:
             self.logger.error(f"Error fetching live games for {league_key}: {e}", exc_info=True)
             return []
 
-    def _parse_game_event(self, event: Dict, league_key: str) -> Optional[Dict]:
+    def _parse_live_event_fast(self, event: Dict, league_key: str, status: Dict,
+                               status_type: Dict, competitors: List[Dict]) -> Optional[Tuple[GameInfo, Dict, Dict]]:
         """
-        Parse a game event and extract relevant information.
+        Parse a live scoreboard event whose status the caller already extracted.
+
+        Assumes two competitors; whichever is not marked home is treated as away.
 
         Args:
             event: ESPN API event dictionary
-            league_key: League identifier for sport-specific parsing
+            league_key: League identifier
+            status: event['status'] dictionary
+            status_type: event['status']['type'] dictionary
+            competitors: Competitors list from the event's first competition
 
         Returns:
-            Dictionary with game info and stat leaders, or None if parsing fails
+            Tuple of (game_data, home_competitor, away_competitor), or None if parsing fails
         """
         try:
-            competition = event.get('competitions', [{}])[0]
-            status = event.get('status', {})
-            competitors = competition.get('competitors', [])
-            game_id = event.get('id')
+            c0, c1 = competitors[0], competitors[1]
+            if c0.get('homeAway') == 'home':
+                home_team, away_team = c0, c1
+            else:
+                home_team, away_team = c1, c0
 
-            if len(competitors) < 2:
-                return None
+            game_data = self._build_game_data(event, league_key, status, status_type,
+                                              home_team, away_team)
+            return game_data, home_team, away_team
 
-            # Identify home and away teams
-            home_team = next((c for c in competitors if c.get('homeAway') == 'home'), None)
-            away_team = next((c for c in competitors if c.get('homeAway') == 'away'), None)
+        except Exception as e:
+            self.logger.warning(f"Error parsing game event: {e}")
+            return None
 
-            if not home_team or not away_team:
-                return None
+    def _build_game_data(self, event: Dict, league_key: str, status: Dict, status_type: Dict,
+                         home_team: Dict, away_team: Dict) -> GameInfo:
+        """
+        Build the basic game record for a scoreboard event.
 
-            # Extract basic game info
-            game_data = {
-                'id': game_id,
-                'league': league_key,
-                'home_abbr': home_team.get('team', {}).get('abbreviation', 'HOME'),
-                'away_abbr': away_team.get('team', {}).get('abbreviation', 'AWAY'),
-                'home_score': int(home_team.get('score', 0)),
-                'away_score': int(away_team.get('score', 0)),
-                'period': status.get('period', 0),
-                'clock': status.get('displayClock', ''),
-                'period_text': status.get('type', {}).get('shortDetail', ''),
-            }
+        Args:
+            event: ESPN API event dictionary
+            league_key: League identifier
+            status: event['status'] dictionary
+            status_type: event['status']['type'] dictionary
+            home_team: Home competitor dictionary
+            away_team: Away competitor dictionary
 
-            # Fetch detailed boxscore for player stats
-            if game_id:
-                boxscore = self._fetch_game_boxscore(game_id, league_key)
-                if boxscore:
-                    # Extract stat leaders from boxscore
-                    if league_key in ['nba', 'ncaam']:
-                        game_data['home_leaders'] = self._extract_boxscore_basketball_leaders(boxscore, 'home')
-                        game_data['away_leaders'] = self._extract_boxscore_basketball_leaders(boxscore, 'away')
-                    elif league_key in ['nfl', 'ncaaf']:
-                        game_data['home_leaders'] = self._extract_boxscore_football_leaders(boxscore, 'home')
-                        game_data['away_leaders'] = self._extract_boxscore_football_leaders(boxscore, 'away')
-                else:
-                    # Fallback to scoreboard data (will likely be None)
-                    if league_key in ['nba', 'ncaam']:
-                        game_data['home_leaders'] = self.extract_basketball_leaders(home_team)
-                        game_data['away_leaders'] = self.extract_basketball_leaders(away_team)
-                    elif league_key in ['nfl', 'ncaaf']:
-                        game_data['home_leaders'] = self.extract_football_leaders(home_team)
-                        game_data['away_leaders'] = self.extract_football_leaders(away_team)
-
-            return game_data
+        Returns:
+            GameInfo without stat leaders
+        """
+        return GameInfo(
+            id=event.get('id'),
+            league=league_key,
+            home_abbr=home_team.get('team', {}).get('abbreviation', 'HOME'),
+            away_abbr=away_team.get('team', {}).get('abbreviation', 'AWAY'),
+            home_score=int(home_team.get('score', 0)),
+            away_score=int(away_team.get('score', 0)),
+            period=status.get('period', 0),
+            clock=status.get('displayClock', ''),
+            period_text=status_type.get('shortDetail', ''),
+            state=self._game_state(status_type),
+        )
+
+    def _apply_leaders(self, game_data: GameInfo, boxscore: Optional[Dict], home_team: Dict,
+                       away_team: Dict, league_key: str):
+        """
+        Populate home/away stat leaders on a parsed game.
+
+        Args:
+            game_data: GameInfo from _parse_live_event_fast (updated in place)
+            boxscore: Boxscore response, or None to fall back to scoreboard data
+            home_team: Home competitor dictionary from the scoreboard event
+            away_team: Away competitor dictionary from the scoreboard event
+            league_key: League identifier
+        """
+        extractors = _LEADER_DISPATCH.get(league_key)
+        if not extractors:
+            return
+
+        boxscore_extractor, scoreboard_extractor = extractors
+
+        try:
+            if boxscore:
+                # Extract stat leaders from boxscore
+                game_data.home_leaders = boxscore_extractor(self, boxscore, 'home')
+                game_data.away_leaders = boxscore_extractor(self, boxscore, 'away')
+            else:
+                # Fallback to scoreboard data (will likely be None)
+                game_data.home_leaders = scoreboard_extractor(self, home_team)
+                game_data.away_leaders = scoreboard_extractor(self, away_team)
 
         except Exception as e:
-            self.logger.warning(f"Error parsing game event: {e}")
+            self.logger.warning(f"Error extracting leaders for game {game_data.id}: {e}")
+
+    def revalidated(self) -> bool:
+        """
+        Report when background boxscore loads from a cold poll have finished.
+
+        Games returned by a league's first poll carry scoreboard leaders and are
+        updated in place once their boxscores arrive; callers re-render when
+        this returns True.
+
+        Returns:
+            True once all pending background loads are done, otherwise False
+        """
+        if not self._revalidating or not all(f.done() for f in self._revalidating):
+            return False
+
+        self._revalidating = []
+        return True
+
+    def _load_leaders(self, game: GameInfo, home_team: Dict, away_team: Dict):
+        """
+        Fetch a boxscore and set leaders on an ESPN game in the background.
+
+        Args:
+            game: GameInfo to update in place
+            home_team: Home competitor dictionary (scoreboard fallback)
+            away_team: Away competitor dictionary (scoreboard fallback)
+        """
+        boxscore = self._fetch_game_boxscore(game.id, game.league, game.state)
+        self._apply_leaders(game, boxscore, home_team, away_team, game.league)
+
+    def _wait_for_boxscores(self, futures: List[Optional[Future]]):
+        """
+        Wait for a batch of submitted boxscore fetches under one shared deadline.
+
+        The whole batch is bounded by BOXSCORE_FETCH_TIMEOUT, so several slow
+        games cannot stack their timeouts on the update path.
+
+        Args:
+            futures: Futures from submitting boxscore fetches (None entries are skipped)
+        """
+        pending = [future for future in futures if future is not None]
+        if pending:
+            wait(pending, timeout=BOXSCORE_FETCH_TIMEOUT)
+
+    def _boxscore_result(self, future: Future, game_id: str) -> Optional[Dict]:
+        """
+        Read a boxscore fetch after _wait_for_boxscores without blocking.
+
+        Args:
+            future: Future returned by submitting a boxscore fetch
+            game_id: Game ID (for logging)
+
+        Returns:
+            Boxscore data or None if the fetch failed or is still running
+        """
+        if not future.done():
+            self.logger.debug(f"Boxscore fetch for game {game_id} did not complete in time")
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.debug(f"Boxscore fetch for game {game_id} failed: {e}")
             return None
 
-    def _fetch_game_boxscore(self, game_id: str, league_key: str) -> Optional[Dict]:
+    @staticmethod
+    def _game_state(status_type: Dict) -> str:
+        """
+        Map an ESPN status type to a TTL_BY_STATE key.
+
+        Args:
+            status_type: ESPN event['status']['type'] dictionary
+
+        Returns:
+            'halftime', or the ESPN state ('pre', 'in', 'post')
+        """
+        if status_type.get('name') == 'STATUS_HALFTIME':
+            return 'halftime'
+        return status_type.get('state') or 'pre'
+
+    def _fetch_game_boxscore(self, game_id: str, league_key: str,
+                             state: str = 'in') -> Optional[Dict]:
         """
         Fetch detailed boxscore for a specific game.
 
         Args:
             game_id: ESPN game ID
             league_key: League identifier
+            state: Game state from _game_state, used to pick the cache TTL
 
         Returns:
             Boxscore data or None if unavailable
@@ -208,13 +647,17 @@ class DataFetcher:
             # ESPN boxscore/summary endpoint
             url = f"https://site.web.api.espn.com/apis/site/v2/sports/{sport}/{league}/summary"
             params = {'event': game_id}
-            cache_key = f"boxscore_{league_key}_{game_id}"
+            # Keyed by sport rather than league so displays polling the same
+            # game share one cache entry (ESPN event IDs are authoritative)
+            cache_key = f"boxscore_{sport}_{game_id}"
 
-            response = self.api_helper.get(
+            response = self._singleflight(
+                cache_key,
+                self.api_helper.get,
                 url,
                 params=params,
                 cache_key=cache_key,
-                cache_ttl=60
+                cache_ttl=TTL_BY_STATE.get(state, TTL_BY_STATE['in'])
             )
 
             return response
@@ -248,7 +691,8 @@ class DataFetcher:
                     break
 
             if not team_data:
-                self.logger.debug(f"No team data found for {home_away} in boxscore")
+                if self._debug:
+                    self.logger.debug(f"No team data found for {home_away} in boxscore")
                 return None
 
             # Get statistics from players
@@ -266,39 +710,32 @@ class DataFetcher:
                 return None
 
             # Extract leaders for PTS, REB, AST
-            leaders = {}
-            max_pts = {'name': None, 'value': 0}
-            max_reb = {'name': None, 'value': 0}
-            max_ast = {'name': None, 'value': 0}
+            best = {stat_type: (0, None) for stat_type, _ in BOXSCORE_BASKETBALL_STAT_INDICES}
 
             for athlete in athletes:
-                name = athlete.get('athlete', {}).get('shortName', athlete.get('athlete', {}).get('displayName', 'Unknown'))
-                stats = athlete.get('stats', [])
+                stats = athlete.get('stats') or ()
 
                 # Stats are usually strings in order, need to find PTS/REB/AST
                 # Common order: MIN, FG, 3PT, FT, OREB, DREB, REB, AST, STL, BLK, TO, PF, PTS
                 # But this varies, so we need to check the labels
-                if len(stats) >= 13:  # Typical basketball stat line length
-                    try:
-                        pts = int(stats[-1]) if stats[-1] else 0  # PTS usually last
-                        reb = int(stats[6]) if len(stats) > 6 and stats[6] else 0  # REB usually index 6
-                        ast = int(stats[7]) if len(stats) > 7 and stats[7] else 0  # AST usually index 7
-
-                        if pts > max_pts['value']:
-                            max_pts = {'name': name, 'value': pts}
-                        if reb > max_reb['value']:
-                            max_reb = {'name': name, 'value': reb}
-                        if ast > max_ast['value']:
-                            max_ast = {'name': name, 'value': ast}
-                    except (ValueError, IndexError):
-                        continue
+                if len(stats) < 13:  # Typical basketball stat line length
+                    continue
 
-            if max_pts['name']:
-                leaders['PTS'] = max_pts
-            if max_reb['name']:
-                leaders['REB'] = max_reb
-            if max_ast['name']:
-                leaders['AST'] = max_ast
+                values = [_safe_int(stats[idx]) for _, idx in BOXSCORE_BASKETBALL_STAT_INDICES]
+
+                name = None  # Resolved only when this athlete takes a lead
+                for (stat_type, _), value in zip(BOXSCORE_BASKETBALL_STAT_INDICES, values):
+                    if value > best[stat_type][0]:
+                        if name is None:
+                            athlete_info = athlete.get('athlete', {})
+                            name = athlete_info.get('shortName', athlete_info.get('displayName', 'Unknown'))
+                        best[stat_type] = (value, name)
+
+            leaders = {
+                stat_type: {'name': top_player, 'value': max_value}
+                for stat_type, (max_value, top_player) in best.items()
+                if top_player
+            }
 
             return leaders if leaders else None
 
@@ -341,46 +778,48 @@ class DataFetcher:
                 self.logger.debug(f"No statistics section found for competitor")
                 return None
 
+            sections = _sections_by_name(stats_section)
+
             # Log what stat sections are available
-            section_names = [s.get('name') for s in stats_section if isinstance(s, dict)]
-            self.logger.debug(f"Available stat sections: {section_names}")
+            if self._debug:
+                self.logger.debug(f"Available stat sections: {list(sections)}")
 
             # Find athletes section
-            athletes_data = next((s for s in stats_section if s.get('name') == 'athletes'), None)
+            athletes_data = sections.get('athletes')
             if not athletes_data or 'athletes' not in athletes_data:
-                self.logger.debug(f"No athletes section found. Stats structure: {stats_section[:1] if stats_section else 'empty'}")
+                if self._debug:
+                    self.logger.debug(f"No athletes section found. Stats structure: {stats_section[:1] if stats_section else 'empty'}")
                 return None
 
             athletes = athletes_data.get('athletes', [])
             if not athletes:
                 return None
 
-            leaders = {}
+            # Find leader for each stat category in a single pass over athletes
+            best = {stat_type: (0, None) for stat_type, _ in _BASKETBALL_STAT_ITEMS}
 
-            # Find leader for each stat category
-            for stat_type, stat_index in BASKETBALL_STAT_INDICES.items():
-                max_value = 0
-                top_player = None
+            for athlete in athletes:
+                stats = athlete.get('stats') or ()
+                name = None  # Resolved only when this athlete takes a lead
 
-                for athlete in athletes:
-                    try:
-                        stats = athlete.get('stats', [])
-                        if len(stats) > stat_index:
-                            value = int(stats[stat_index])
-                            if value > max_value:
-                                max_value = value
-                                # Use shortName if available, otherwise displayName
-                                athlete_info = athlete.get('athlete', {})
-                                top_player = athlete_info.get('shortName',
-                                            athlete_info.get('displayName', 'Unknown'))
-                    except (ValueError, TypeError, IndexError):
+                for stat_type, stat_index in _BASKETBALL_STAT_ITEMS:
+                    if len(stats) <= stat_index:
                         continue
 
-                if top_player and max_value > 0:
-                    leaders[stat_type] = {
-                        'name': top_player,
-                        'value': max_value
-                    }
+                    value = _safe_int(stats[stat_index])
+                    if value > best[stat_type][0]:
+                        if name is None:
+                            # Use shortName if available, otherwise displayName
+                            athlete_info = athlete.get('athlete', {})
+                            name = athlete_info.get('shortName',
+                                                    athlete_info.get('displayName', 'Unknown'))
+                        best[stat_type] = (value, name)
+
+            leaders = {
+                stat_type: {'name': top_player, 'value': max_value}
+                for stat_type, (max_value, top_player) in best.items()
+                if top_player and max_value > 0
+            }
 
             return leaders if leaders else None
 
@@ -406,10 +845,11 @@ class DataFetcher:
             if not stats_section:
                 return None
 
+            sections = _sections_by_name(stats_section)
             leaders = {}
 
             # Extract QB (top passer)
-            passing_data = next((s for s in stats_section if s.get('name') == 'passing'), None)
+            passing_data = sections.get('passing')
             if passing_data and passing_data.get('athletes'):
                 qb = passing_data['athletes'][0]  # Top passer
                 qb_stats = qb.get('stats', [])
@@ -429,7 +869,7 @@ class DataFetcher:
                         pass
 
             # Extract WR (top receiver)
-            receiving_data = next((s for s in stats_section if s.get('name') == 'receiving'), None)
+            receiving_data = sections.get('receiving')
             if receiving_data and receiving_data.get('athletes'):
                 wr = receiving_data['athletes'][0]  # Top receiver
                 wr_stats = wr.get('stats', [])
@@ -449,7 +889,7 @@ class DataFetcher:
                         pass
 
             # Extract RB (top rusher)
-            rushing_data = next((s for s in stats_section if s.get('name') == 'rushing'), None)
+            rushing_data = sections.get('rushing')
             if rushing_data and rushing_data.get('athletes'):
                 rb = rushing_data['athletes'][0]  # Top rusher
                 rb_stats = rb.get('stats', [])
@@ -484,19 +924,9 @@ class DataFetcher:
         Returns:
             Abbreviated name (e.g., "P. Mahomes" or "Mahomes")
         """
-        parts = full_name.split()
-
-        if len(parts) >= 2:
-            # Use last name only if short enough
-            if len(parts[-1]) <= 8:
-                return parts[-1]
-            # Otherwise use "F. Lastname" format
-            return f"{parts[0][0]}. {parts[-1]}"
+        return _abbreviate_name(full_name)
 
-        # Single name or unknown - truncate if too long
-        return full_name[:10] if len(full_name) > 10 else full_name
-
-    def _fetch_ncaa_basketball_games(self, max_games: int = 50) -> List[Dict]:
+    def _fetch_ncaa_basketball_games(self, max_games: int = 50) -> List[GameInfo]:
         """
         Fetch live NCAA Men's Basketball games using NCAA API.
 
@@ -504,7 +934,7 @@ class DataFetcher:
             max_games: Maximum number of games to return
 
         Returns:
-            List of game dictionaries with extracted stats
+            List of GameInfo records with extracted stats
         """
         try:
             # Get today's date for scoreboard
@@ -517,24 +947,22 @@ class DataFetcher:
             url = f"{NCAA_API_BASE}/scoreboard/basketball-men/d1/{year}/{month}/{day}"
             self.logger.debug(f"Fetching NCAA scoreboard from: {url}")
 
-            # Use requests directly since NCAA API isn't cached by api_helper
-            import requests
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            scoreboard = response.json()
+            # Use the pooled session directly since NCAA API isn't cached by api_helper
+            scoreboard = self._get_json(url)
 
             if not scoreboard or 'games' not in scoreboard:
                 self.logger.debug("No scoreboard data from NCAA API")
                 return []
 
-            # Extract live games
-            live_games = []
+            # Collect live games (header info only; boxscores are fetched below)
+            live_headers = []
             total_events = len(scoreboard.get('games', []))
-            self.logger.debug(f"Processing {total_events} total NCAA games")
+            if self._debug:
+                self.logger.debug(f"Processing {total_events} total NCAA games")
 
             for game_wrapper in scoreboard.get('games', []):
                 # Stop if we've reached max games
-                if len(live_games) >= max_games:
+                if len(live_headers) >= max_games:
                     self.logger.info(f"Reached max_games limit ({max_games}) for NCAA")
                     break
 
@@ -552,12 +980,28 @@ class DataFetcher:
                     continue
 
                 # Parse game data
-                game_info = self._parse_ncaa_game(game)
+                game_info = self._parse_ncaa_game_header(game)
                 if game_info:
-                    live_games.append(game_info)
-                    self.logger.info(f"Parsed NCAA game: {game_info.get('away_abbr')} @ {game_info.get('home_abbr')}, "
-                                   f"home_leaders: {bool(game_info.get('home_leaders'))}, "
-                                   f"away_leaders: {bool(game_info.get('away_leaders'))}")
+                    live_headers.append(game_info)
+
+            # Fetch boxscores concurrently over the pooled session
+            futures = [
+                self._executor.submit(self._fetch_ncaa_boxscore, game_info.id)
+                if game_info.id else None
+                for game_info in live_headers
+            ]
+            self._wait_for_boxscores(futures)
+
+            live_games = []
+            for game_info, future in zip(live_headers, futures):
+                if future is not None:
+                    boxscore = self._boxscore_result(future, game_info.id)
+                    self._apply_ncaa_leaders(game_info, boxscore)
+
+                live_games.append(game_info)
+                self.logger.info(f"Parsed NCAA game: {game_info.away_abbr} @ {game_info.home_abbr}, "
+                               f"home_leaders: {bool(game_info.home_leaders)}, "
+                               f"away_leaders: {bool(game_info.away_leaders)}")
 
             self.logger.info(f"Found {len(live_games)} live NCAA games (out of {total_events} total, max={max_games})")
             return live_games
@@ -566,15 +1010,15 @@ class DataFetcher:
             self.logger.error(f"Error fetching NCAA games: {e}", exc_info=True)
             return []
 
-    def _parse_ncaa_game(self, game: Dict) -> Optional[Dict]:
+    def _parse_ncaa_game_header(self, game: Dict) -> Optional[GameInfo]:
         """
-        Parse NCAA game data and fetch boxscore for player stats.
+        Parse teams, score and period from an NCAA scoreboard game.
 
         Args:
             game: Game dictionary from NCAA API scoreboard
 
         Returns:
-            Dictionary with game info and stat leaders, or None if parsing fails
+            GameInfo without stat leaders, or None if parsing fails
         """
         try:
             game_id = game.get('gameID')
@@ -582,31 +1026,34 @@ class DataFetcher:
             away = game.get('away', {})
 
             # Extract basic game info
-            game_data = {
-                'id': game_id,
-                'league': 'ncaam',
-                'home_abbr': home.get('names', {}).get('char6', 'HOME'),
-                'away_abbr': away.get('names', {}).get('char6', 'AWAY'),
-                'home_score': int(home.get('score', 0)),
-                'away_score': int(away.get('score', 0)),
-                'period': 0,  # NCAA API uses currentPeriod text
-                'clock': game.get('contestClock', ''),
-                'period_text': game.get('currentPeriod', ''),
-            }
-
-            # Fetch boxscore for player stats
-            if game_id:
-                boxscore = self._fetch_ncaa_boxscore(game_id)
-                if boxscore:
-                    game_data['home_leaders'] = self._extract_ncaa_basketball_leaders(boxscore, is_home=True)
-                    game_data['away_leaders'] = self._extract_ncaa_basketball_leaders(boxscore, is_home=False)
-
-            return game_data
+            return GameInfo(
+                id=game_id,
+                league='ncaam',
+                home_abbr=home.get('names', {}).get('char6', 'HOME'),
+                away_abbr=away.get('names', {}).get('char6', 'AWAY'),
+                home_score=int(home.get('score', 0)),
+                away_score=int(away.get('score', 0)),
+                period=0,  # NCAA API uses currentPeriod text
+                clock=game.get('contestClock', ''),
+                period_text=game.get('currentPeriod', ''),
+            )
 
         except Exception as e:
             self.logger.warning(f"Error parsing NCAA game: {e}")
             return None
 
+    def _apply_ncaa_leaders(self, game_data: GameInfo, boxscore: Optional[Dict]):
+        """
+        Populate home/away stat leaders from an NCAA boxscore.
+
+        Args:
+            game_data: GameInfo from _parse_ncaa_game_header (updated in place)
+            boxscore: NCAA boxscore response, or None if unavailable
+        """
+        if boxscore:
+            game_data.home_leaders = self._extract_ncaa_basketball_leaders(boxscore, is_home=True)
+            game_data.away_leaders = self._extract_ncaa_basketball_leaders(boxscore, is_home=False)
+
     def _fetch_ncaa_boxscore(self, game_id: str) -> Optional[Dict]:
         """
         Fetch NCAA boxscore data.
@@ -619,12 +1066,10 @@ class DataFetcher:
         """
         try:
             url = f"{NCAA_API_BASE}/game/{game_id}/boxscore"
-            self.logger.debug(f"Fetching NCAA boxscore from: {url}")
+            if self._debug:
+                self.logger.debug(f"Fetching NCAA boxscore from: {url}")
 
-            import requests
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url)
 
         except Exception as e:
             self.logger.debug(f"Error fetching NCAA boxscore for game {game_id}: {e}")
@@ -645,7 +1090,8 @@ class DataFetcher:
             teams_info = boxscore.get('teams', [])
             team_boxscore = boxscore.get('teamBoxscore', [])
 
-            self.logger.debug(f"NCAA boxscore has {len(teams_info)} teams and {len(team_boxscore)} team stats")
+            if self._debug:
+                self.logger.debug(f"NCAA boxscore has {len(teams_info)} teams and {len(team_boxscore)} team stats")
 
             if not teams_info or not team_boxscore:
                 self.logger.debug("Missing teams or teamBoxscore data")
@@ -657,17 +1103,20 @@ class DataFetcher:
                 if team_info.get('isHome') == is_home:
                     team_index = idx
                     team_name = team_info.get('nameShort', '?')
-                    self.logger.debug(f"Found {'home' if is_home else 'away'} team at index {idx}: {team_name}")
+                    if self._debug:
+                        self.logger.debug(f"Found {'home' if is_home else 'away'} team at index {idx}: {team_name}")
                     break
 
             if team_index is None or team_index >= len(team_boxscore):
-                self.logger.debug(f"Could not find team index for {'home' if is_home else 'away'}")
+                if self._debug:
+                    self.logger.debug(f"Could not find team index for {'home' if is_home else 'away'}")
                 return None
 
             team_data = team_boxscore[team_index]
             player_stats = team_data.get('playerStats', [])
 
-            self.logger.debug(f"Found {len(player_stats)} players for {'home' if is_home else 'away'} team")
+            if self._debug:
+                self.logger.debug(f"Found {len(player_stats)} players for {'home' if is_home else 'away'} team")
 
             if not player_stats:
                 return None
@@ -697,21 +1146,34 @@ class DataFetcher:
                         max_ast = {'name': self._abbreviate_name(full_name), 'value': ast}
 
                 except (ValueError, TypeError) as e:
-                    self.logger.debug(f"Error parsing stats for {full_name}: {e}")
+                    if self._debug:
+                        self.logger.debug(f"Error parsing stats for {full_name}: {e}")
                     continue
 
             if max_pts['name']:
                 leaders['PTS'] = max_pts
-                self.logger.debug(f"PTS leader: {max_pts['name']} - {max_pts['value']}")
+                if self._debug:
+                    self.logger.debug(f"PTS leader: {max_pts['name']} - {max_pts['value']}")
             if max_reb['name']:
                 leaders['REB'] = max_reb
-                self.logger.debug(f"REB leader: {max_reb['name']} - {max_reb['value']}")
+                if self._debug:
+                    self.logger.debug(f"REB leader: {max_reb['name']} - {max_reb['value']}")
             if max_ast['name']:
                 leaders['AST'] = max_ast
-                self.logger.debug(f"AST leader: {max_ast['name']} - {max_ast['value']}")
+                if self._debug:
+                    self.logger.debug(f"AST leader: {max_ast['name']} - {max_ast['value']}")
 
             return leaders if leaders else None
 
         except Exception as e:
             self.logger.error(f"Error extracting NCAA basketball leaders: {e}", exc_info=True)
             return None
+
+
+# Per-league leader extractors: league_key -> (boxscore extractor, scoreboard extractor)
+_LEADER_DISPATCH = {
+    'nba': (DataFetcher._extract_boxscore_basketball_leaders, DataFetcher.extract_basketball_leaders),
+    'ncaam': (DataFetcher._extract_boxscore_basketball_leaders, DataFetcher.extract_basketball_leaders),
+    'nfl': (DataFetcher._extract_boxscore_football_leaders, DataFetcher.extract_football_leaders),
+    'ncaaf': (DataFetcher._extract_boxscore_football_leaders, DataFetcher.extract_football_leaders),
+}
@@ -214,6 +214,10 @@ class LivePlayerStatsPlugin(BasePlugin):
             if force_clear:
                 self.display_manager.clear()
 
+            # Re-render once boxscore leaders arrive for games from a cold poll
+            if self.data_fetcher.revalidated():
+                self._render_scrolling_content()
+
             # Update scroll position
             self.scroll_helper.update_scroll_position()
 
@@ -272,4 +276,5 @@ class LivePlayerStatsPlugin(BasePlugin):
     def cleanup(self):
         """Cleanup resources when plugin is unloaded."""
         self.logger.info("Cleaning up LivePlayerStats plugin")
+        self.data_fetcher.close()
         super().cleanup()
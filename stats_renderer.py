@@ -4,10 +4,15 @@ Rendering module for LivePlayerStats plugin.
 Handles PIL-based rendering of player stat cards for scrolling display.
 """
 #Testing if Rob Can push
-from typing import Dict, Optional
-from PIL import Image, ImageDraw, ImageFont
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from pathlib import Path
+import functools
 import os
+import string
+
+from data_fetcher import GameInfo
 
 
 # Color scheme
@@ -16,10 +21,55 @@ COLOR_LIGHT_BLUE = (77, 190, 238)
 COLOR_GRAY = (170, 170, 170)
 COLOR_BLACK = (0, 0, 0)
 
+# Characters pre-rasterized into the glyph atlas (team abbrs, names, scores, status)
+ATLAS_CHARSET = string.ascii_letters + string.digits + " :@/.-'()"
+
+# Message shown when no live games are available
+NO_GAMES_MESSAGE = "No live games"
+
+# Maximum number of rendered game cards kept for reuse across scroll rebuilds
+CARD_CACHE_SIZE = 64
+
+# Maximum number of idle image buffers kept per (mode, width, height)
+IMAGE_POOL_SIZE = 4
+
+
+# LEDMatrix root directory (three levels above this plugin) and font paths
+_PROJECT_ROOT = Path(os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..')))
+_FONT_DIR = os.path.join(str(_PROJECT_ROOT), 'assets', 'fonts')
+_FONT_4X6 = os.path.join(_FONT_DIR, '4x6-font.ttf')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(path: str, size: int):
+    """
+    Load a TrueType font once per (path, size).
+
+    Args:
+        path: Font file path
+        size: Font size in points
+
+    Returns:
+        PIL FreeTypeFont, or None if the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_default_font():
+    """Load PIL's built-in default font once."""
+    return ImageFont.load_default()
+
 
 class StatsRenderer:
     """Renders player statistics as game cards for scrolling display."""
 
+    # Leader categories in display order
+    _BASKETBALL_CATEGORIES = ('PTS', 'REB', 'AST')
+    _FOOTBALL_CATEGORIES = ('QB', 'WR', 'RB')
+
     def __init__(self, font_manager, logger, display_height=32):
         """
         Initialize stats renderer.
@@ -34,34 +84,241 @@ class StatsRenderer:
         self.display_height = display_height
 
         # Find LEDMatrix root directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.project_root = Path(os.path.abspath(os.path.join(current_dir, '..', '..', '..')))
+        self.project_root = _PROJECT_ROOT
         self.logger.debug(f"Project root: {self.project_root}")
 
         # Load fonts (using compact fonts for small display)
         try:
-            # Try to get 4x6 font for compact display
-            self.small_font = ImageFont.load_default()
-            self.medium_font = ImageFont.load_default()
+            self.small_font = _load_default_font()
+            self.medium_font = _load_default_font()
 
             # Attempt to load better fonts if available
-            font_dir = self.project_root / 'assets' / 'fonts'
-
             try:
-                font_path_4x6 = font_dir / '4x6-font.ttf'
-                if font_path_4x6.exists():
-                    self.small_font = ImageFont.truetype(str(font_path_4x6), 6)
-                    self.medium_font = ImageFont.truetype(str(font_path_4x6), 8)
+                self.small_font = _load_font(_FONT_4X6, 6) or self.small_font
+                self.medium_font = _load_font(_FONT_4X6, 8) or self.medium_font
             except Exception as e:
                 self.logger.debug(f"Could not load custom fonts: {e}")
-                pass
 
         except Exception as e:
             self.logger.warning(f"Error loading fonts, using defaults: {e}")
             self.small_font = ImageFont.load_default()
             self.medium_font = ImageFont.load_default()
 
-    def render_game_card(self, game_data: Dict, card_width: int = 192) -> Image.Image:
+        # Fonts by key so rasterized text tiles can be cached on hashable keys
+        self._fonts = {'small': self.small_font, 'medium': self.medium_font}
+        self._text_tile = functools.lru_cache(maxsize=512)(self._render_text_tile)
+        self._text_block = functools.lru_cache(maxsize=256)(self._render_text_block)
+        self._leader_lines = functools.lru_cache(maxsize=256)(self._build_leader_lines)
+
+        # Per-character glyph masks for fixed-width fonts (None if not applicable)
+        self._atlas = {key: self._build_atlas(font) for key, font in self._fonts.items()}
+
+        # Rendered cards keyed on the game content they were drawn from (LRU)
+        self._card_cache: OrderedDict = OrderedDict()
+
+        # Idle RGB buffers by (mode, width, height) for panel and card scratch images
+        self._img_pool: Dict[tuple, list] = {}
+
+        # Placeholder text is fixed, so measure it once and cache images by width
+        self._no_games_size = self._probe_text_size(NO_GAMES_MESSAGE, self.medium_font)
+        self._placeholder_cache: Dict[int, Image.Image] = {}
+
+    @staticmethod
+    def _probe_text_size(text: str, font) -> Tuple[int, int]:
+        """
+        Measure rendered text using a throwaway draw context.
+
+        Args:
+            text: Text to measure
+            font: PIL font
+
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        try:
+            bbox = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text, font=font)
+            return bbox[2] - bbox[0], bbox[3] - bbox[1]
+        except Exception:
+            # Fallback if textbbox not available
+            return len(text) * 6, 8
+
+    def _acquire(self, width: int) -> Image.Image:
+        """
+        Get a black RGB image of the given width at display height.
+
+        Reuses a pooled buffer when one is available.
+
+        Args:
+            width: Image width in pixels
+
+        Returns:
+            PIL Image cleared to black, owned by the caller until released
+        """
+        key = ('RGB', width, self.display_height)
+        pool = self._img_pool.get(key)
+        if pool:
+            img = pool.pop()
+            img.paste(COLOR_BLACK, (0, 0, width, self.display_height))
+            return img
+        return Image.new('RGB', (width, self.display_height), color=COLOR_BLACK)
+
+    def _release(self, img: Image.Image):
+        """
+        Return an image obtained from _acquire to the pool.
+
+        The caller must not use the image afterwards.
+
+        Args:
+            img: Image to recycle
+        """
+        pool = self._img_pool.setdefault((img.mode, img.width, img.height), [])
+        if len(pool) < IMAGE_POOL_SIZE:
+            pool.append(img)
+
+    @staticmethod
+    def _rasterize(text: str, font) -> Tuple[Image.Image, int, int]:
+        """
+        Rasterize text with FreeType into a grayscale coverage mask.
+
+        Args:
+            text: Text to render
+            font: PIL font
+
+        Returns:
+            Tuple of (mask image, x offset, y offset) relative to the draw origin
+        """
+        left, top, right, bottom = font.getbbox(text)
+        left = min(left, 0)
+        top = min(top, 0)
+        tile = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+        ImageDraw.Draw(tile).text((-left, -top), text, font=font, fill=255)
+        return tile, left, top
+
+    def _build_atlas(self, font) -> Optional[Tuple[Dict[str, Tuple[Image.Image, int, int]], int]]:
+        """
+        Pre-rasterize ATLAS_CHARSET for a font with a fixed integer advance.
+
+        Strings in such a font can be assembled glyph by glyph at
+        x += advance without FreeType layout, giving the same pixels.
+
+        Args:
+            font: PIL font
+
+        Returns:
+            Tuple of ({char: (mask, x offset, y offset)}, advance), or None if
+            the font is proportional or has fractional advances
+        """
+        try:
+            advances = {font.getlength(ch) for ch in ATLAS_CHARSET}
+        except Exception as e:
+            self.logger.debug(f"Glyph atlas unavailable: {e}")
+            return None
+
+        if len(advances) != 1:
+            return None
+        advance = advances.pop()
+        if advance != int(advance):
+            return None
+
+        return {ch: self._rasterize(ch, font) for ch in ATLAS_CHARSET}, int(advance)
+
+    def _render_text_tile(self, text: str, font_key: str) -> Tuple[Image.Image, int, int]:
+        """
+        Rasterize text once into a grayscale coverage mask.
+
+        Uses the glyph atlas when the font has one and covers every character,
+        otherwise falls back to FreeType.
+
+        Args:
+            text: Text to render
+            font_key: Key into self._fonts ('small' or 'medium')
+
+        Returns:
+            Tuple of (mask image, x offset, y offset) relative to the draw origin
+        """
+        atlas = self._atlas.get(font_key)
+        if not atlas or not text or not all(ch in atlas[0] for ch in text):
+            return self._rasterize(text, self._fonts[font_key])
+
+        glyphs, advance = atlas
+        placed = []
+        for i, ch in enumerate(text):
+            mask, dx, dy = glyphs[ch]
+            placed.append((mask, i * advance + dx, dy))
+        return self._compose_masks(placed)
+
+    def _render_text_block(self, items: Tuple[Tuple[Tuple[int, int], str], ...],
+                           font_key: str) -> Tuple[Image.Image, int, int]:
+        """
+        Combine several strings drawn in the same font into one coverage mask.
+
+        Args:
+            items: Tuple of ((x, y), text) draw origins and strings
+            font_key: Key into self._fonts ('small' or 'medium')
+
+        Returns:
+            Tuple of (mask image, x offset, y offset) relative to (0, 0)
+        """
+        placed = []
+        for (x, y), text in items:
+            tile, dx, dy = self._text_tile(text, font_key)
+            placed.append((tile, x + dx, y + dy))
+        return self._compose_masks(placed)
+
+    @staticmethod
+    def _compose_masks(placed: list) -> Tuple[Image.Image, int, int]:
+        """
+        Merge positioned coverage masks into a single mask.
+
+        Args:
+            placed: List of (mask, x, y) with positions relative to a common origin
+
+        Returns:
+            Tuple of (mask image, x offset, y offset) relative to that origin
+        """
+        left = min(x for _, x, _ in placed)
+        top = min(y for _, _, y in placed)
+        right = max(x + mask.width for mask, x, _ in placed)
+        bottom = max(y + mask.height for mask, _, y in placed)
+
+        tile = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+        for mask, x, y in placed:
+            box = (x - left, y - top, x - left + mask.width, y - top + mask.height)
+            # Combine with lighter so overlapping boxes keep both coverages
+            tile.paste(ImageChops.lighter(tile.crop(box), mask), box)
+        return tile, left, top
+
+    def _draw_text(self, img: Image.Image, xy: Tuple[int, int], text: str, font_key: str, color):
+        """
+        Draw text by pasting a cached rasterized tile instead of calling draw.text.
+
+        Args:
+            img: Image to draw onto
+            xy: Draw origin, as for ImageDraw.text
+            text: Text to draw
+            font_key: Key into self._fonts ('small' or 'medium')
+            color: Fill color
+        """
+        tile, dx, dy = self._text_tile(text, font_key)
+        img.paste(color, (xy[0] + dx, xy[1] + dy), tile)
+
+    def _draw_text_block(self, img: Image.Image, items: Tuple[Tuple[Tuple[int, int], str], ...],
+                         font_key: str, color):
+        """
+        Draw several same-color, same-font strings with a single paste.
+
+        Args:
+            img: Image to draw onto
+            items: Tuple of ((x, y), text) draw origins and strings
+            font_key: Key into self._fonts ('small' or 'medium')
+            color: Fill color
+        """
+        if not items:
+            return
+        block, dx, dy = self._text_block(items, font_key)
+        img.paste(color, (dx, dy), block)
+
+    def render_game_card(self, game_data: GameInfo, card_width: int = 192) -> Image.Image:
         """
         Render a game card with player statistics in 3-panel layout.
 
@@ -69,48 +326,65 @@ class StatsRenderer:
         Each panel is 64px wide.
 
         Args:
-            game_data: Game dictionary with team info and stat leaders
+            game_data: GameInfo with team info and stat leaders
             card_width: Width of the card in pixels (default: 192 for 3 panels)
 
         Returns:
             PIL Image of the game card
         """
+        try:
+            key = self._card_key(game_data, card_width)
+            cached = self._card_cache.get(key)
+            if cached is not None:
+                self._card_cache.move_to_end(key)
+                return cached.copy()
+        except Exception as e:
+            self.logger.debug(f"Card cache key failed, rendering uncached: {e}")
+            key = None
+
         try:
             # Extract game info
-            away_abbr = game_data.get('away_abbr', 'AWAY')
-            home_abbr = game_data.get('home_abbr', 'HOME')
-            away_score = game_data.get('away_score', 0)
-            home_score = game_data.get('home_score', 0)
-            period_text = game_data.get('period_text', '')
-            clock = game_data.get('clock', '')
-            away_leaders = game_data.get('away_leaders')
-            home_leaders = game_data.get('home_leaders')
-            league = game_data.get('league', 'ncaam')
+            away_abbr = game_data.away_abbr
+            home_abbr = game_data.home_abbr
+            away_score = game_data.away_score
+            home_score = game_data.home_score
+            period_text = game_data.period_text
+            clock = game_data.clock
+            away_leaders = game_data.away_leaders
+            home_leaders = game_data.home_leaders
+            league = game_data.league
 
             # Panel dimensions
             panel_width = 64
             total_width = panel_width * 3  # 3 panels
 
             # Create full image
-            img = Image.new('RGB', (total_width, self.display_height), color=COLOR_BLACK)
-            draw = ImageDraw.Draw(img)
+            img = self._acquire(total_width)
 
             # --- PANEL 1: Game Info with Logos (Left) ---
             panel1_x = 0
             panel1 = self._render_game_info_panel(away_abbr, home_abbr, away_score, home_score,
                                                   period_text, clock, league)
             img.paste(panel1, (panel1_x, 0))
+            self._release(panel1)
 
             # --- PANEL 2: Away Team Stats (Middle) ---
             panel2_x = panel_width
             panel2 = self._render_stats_panel(away_abbr, away_leaders, league)
             img.paste(panel2, (panel2_x, 0))
+            self._release(panel2)
 
             # --- PANEL 3: Home Team Stats (Right) ---
             panel3_x = panel_width * 2
             panel3 = self._render_stats_panel(home_abbr, home_leaders, league)
             img.paste(panel3, (panel3_x, 0))
+            self._release(panel3)
 
+            if key is not None:
+                self._card_cache[key] = img
+                if len(self._card_cache) > CARD_CACHE_SIZE:
+                    self._release(self._card_cache.popitem(last=False)[1])
+                return img.copy()
             return img
 
         except Exception as e:
@@ -118,6 +392,44 @@ class StatsRenderer:
             # Return error card
             return self._create_error_card(card_width)
 
+    @staticmethod
+    def _leaders_key(leaders: Optional[Dict]) -> tuple:
+        """
+        Build a hashable key from the leader fields a stats panel draws.
+
+        Args:
+            leaders: Dictionary of stat leaders
+
+        Returns:
+            Tuple of (category, name, value or stats) sorted by category
+        """
+        if not leaders:
+            return ()
+        return tuple(
+            (cat, leader.get('name'), leader.get('value', leader.get('stats')))
+            for cat, leader in sorted(leaders.items())
+        )
+
+    def _card_key(self, game_data: GameInfo, card_width: int) -> tuple:
+        """
+        Build the card cache key from everything render_game_card draws.
+
+        Args:
+            game_data: GameInfo with team info and stat leaders
+            card_width: Width of the card in pixels
+
+        Returns:
+            Hashable tuple identifying the card's content
+        """
+        return (
+            game_data.league, game_data.away_abbr, game_data.home_abbr,
+            game_data.away_score, game_data.home_score,
+            game_data.period_text, game_data.clock,
+            self._leaders_key(game_data.away_leaders),
+            self._leaders_key(game_data.home_leaders),
+            card_width,
+        )
+
     def _render_game_info_panel(self, away_abbr: str, home_abbr: str, away_score: int,
                                 home_score: int, period_text: str, clock: str, league: str) -> Image.Image:
         """
@@ -136,8 +448,7 @@ class StatsRenderer:
             PIL Image of game info panel (64x32)
         """
         panel_width = 64
-        panel = Image.new('RGB', (panel_width, self.display_height), color=COLOR_BLACK)
-        draw = ImageDraw.Draw(panel)
+        panel = self._acquire(panel_width)
 
         # Get team logos
         self.logger.debug(f"Loading logos for {away_abbr} @ {home_abbr} (league: {league})")
@@ -171,11 +482,11 @@ class StatsRenderer:
             panel.paste(away_logo, (current_x, logo_y), away_logo if away_logo.mode == 'RGBA' else None)
         else:
             # Draw team abbr if no logo
-            draw.text((current_x, 2), away_abbr[:4], font=self.small_font, fill=COLOR_WHITE)
+            self._draw_text(panel, (current_x, 2), away_abbr[:4], 'small', COLOR_WHITE)
 
         # Away score
         score_x = current_x + logo_size + 2
-        draw.text((score_x, 2), str(away_score), font=self.medium_font, fill=COLOR_WHITE)
+        self._draw_text(panel, (score_x, 2), str(away_score), 'medium', COLOR_WHITE)
 
         # --- BOTTOM HALF: Home Team ---
         # Logo or team abbr
@@ -184,10 +495,10 @@ class StatsRenderer:
             panel.paste(home_logo, (current_x, logo_y), home_logo if home_logo.mode == 'RGBA' else None)
         else:
             # Draw team abbr if no logo
-            draw.text((current_x, self.display_height - 8), home_abbr[:4], font=self.small_font, fill=COLOR_WHITE)
+            self._draw_text(panel, (current_x, self.display_height - 8), home_abbr[:4], 'small', COLOR_WHITE)
 
         # Home score
-        draw.text((score_x, self.display_height - 10), str(home_score), font=self.medium_font, fill=COLOR_WHITE)
+        self._draw_text(panel, (score_x, self.display_height - 10), str(home_score), 'medium', COLOR_WHITE)
 
         # --- MIDDLE: Period/Clock ---
         if period_text:
@@ -195,7 +506,7 @@ class StatsRenderer:
             status_text = period_text[:8]
             # Center it
             y_center = self.display_height // 2
-            draw.text((current_x, y_center - 3), status_text, font=self.small_font, fill=COLOR_GRAY)
+            self._draw_text(panel, (current_x, y_center - 3), status_text, 'small', COLOR_GRAY)
 
         return panel
 
@@ -212,8 +523,7 @@ class StatsRenderer:
             PIL Image of stats panel (64x32)
         """
         panel_width = 64
-        panel = Image.new('RGB', (panel_width, self.display_height), color=COLOR_BLACK)
-        draw = ImageDraw.Draw(panel)
+        panel = self._acquire(panel_width)
 
         # Team logo at top
         logo = self._get_team_logo(league, team_abbr)
@@ -227,13 +537,15 @@ class StatsRenderer:
 
         # Draw stat leaders
         if leaders and ('PTS' in leaders or 'REB' in leaders or 'AST' in leaders):
+            # Leader lines share font and color, so collect them and paste once
+            lines = []
+
             # Points leader
             if 'PTS' in leaders:
                 pts_leader = leaders['PTS']
                 name = self._abbreviate_display_name(pts_leader.get('name', '?'), max_length=6)
                 value = pts_leader.get('value', 0)
-                text = f"P:{name} {value}"
-                draw.text((2, y_pos), text, font=self.small_font, fill=COLOR_LIGHT_BLUE)
+                lines.append(((2, y_pos), f"P:{name} {value}"))
                 y_pos += 16
 
             # Rebounds leader
@@ -241,8 +553,7 @@ class StatsRenderer:
                 reb_leader = leaders['REB']
                 name = self._abbreviate_display_name(reb_leader.get('name', '?'), max_length=6)
                 value = reb_leader.get('value', 0)
-                text = f"R:{name} {value}"
-                draw.text((2, y_pos), text, font=self.small_font, fill=COLOR_LIGHT_BLUE)
+                lines.append(((2, y_pos), f"R:{name} {value}"))
                 y_pos += 10
 
             # Assists leader
@@ -250,11 +561,12 @@ class StatsRenderer:
                 ast_leader = leaders['AST']
                 name = self._abbreviate_display_name(ast_leader.get('name', '?'), max_length=6)
                 value = ast_leader.get('value', 0)
-                text = f"A:{name} {value}"
-                draw.text((2, y_pos), text, font=self.small_font, fill=COLOR_LIGHT_BLUE)
+                lines.append(((2, y_pos), f"A:{name} {value}"))
+
+            self._draw_text_block(panel, tuple(lines), 'small', COLOR_LIGHT_BLUE)
         else:
             # No stats
-            draw.text((2, y_pos), "No stats", font=self.small_font, fill=COLOR_GRAY)
+            self._draw_text(panel, (2, y_pos), "No stats", 'small', COLOR_GRAY)
 
         return panel
 
@@ -262,6 +574,8 @@ class StatsRenderer:
         """
         Format leader stats with one line per stat category.
 
+        Not used by card rendering (see _render_stats_panel); kept for text output.
+
         Args:
             team_abbr: Team abbreviation
             leaders: Dictionary of stat leaders
@@ -272,101 +586,61 @@ class StatsRenderer:
         if not leaders:
             return []
 
-        lines = []
-
-        # Check if this is basketball or football stats
-        if 'PTS' in leaders or 'REB' in leaders or 'AST' in leaders:
-            # Basketball format: Show each leader separately
-            if 'PTS' in leaders:
-                pts_leader = leaders['PTS']
-                name = self._abbreviate_display_name(pts_leader.get('name', '?'), max_length=10)
-                value = pts_leader.get('value', 0)
-                lines.append(f"{team_abbr} PTS: {name} {value}")
-
-            if 'REB' in leaders:
-                reb_leader = leaders['REB']
-                name = self._abbreviate_display_name(reb_leader.get('name', '?'), max_length=10)
-                value = reb_leader.get('value', 0)
-                lines.append(f"{team_abbr} REB: {name} {value}")
+        # Basketball categories take precedence over football ones
+        for categories in (self._BASKETBALL_CATEGORIES, self._FOOTBALL_CATEGORIES):
+            present = [cat for cat in categories if cat in leaders]
+            if present:
+                break
+        else:
+            return []
 
-            if 'AST' in leaders:
-                ast_leader = leaders['AST']
-                name = self._abbreviate_display_name(ast_leader.get('name', '?'), max_length=10)
-                value = ast_leader.get('value', 0)
-                lines.append(f"{team_abbr} AST: {name} {value}")
+        key = tuple(
+            (cat, leaders[cat].get('name', '?'), leaders[cat].get('value', 0), leaders[cat].get('stats', ''))
+            for cat in present
+        )
+        return list(self._leader_lines(team_abbr, key))
 
-        elif 'QB' in leaders or 'WR' in leaders or 'RB' in leaders:
-            # Football format: Show each position leader
-            if 'QB' in leaders:
-                name = leaders['QB'].get('name', '?')
-                stats = leaders['QB'].get('stats', '')
-                stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                lines.append(f"{team_abbr} QB: {name} {stats_short}")
+    def _build_leader_lines(self, team_abbr: str, key: tuple) -> Tuple[str, ...]:
+        """
+        Build the detailed leader lines for a hashable leader key.
 
-            if 'WR' in leaders:
-                name = leaders['WR'].get('name', '?')
-                stats = leaders['WR'].get('stats', '')
-                stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                lines.append(f"{team_abbr} WR: {name} {stats_short}")
+        Args:
+            team_abbr: Team abbreviation
+            key: Tuple of (category, name, value, stats) in display order
 
-            if 'RB' in leaders:
-                name = leaders['RB'].get('name', '?')
-                stats = leaders['RB'].get('stats', '')
+        Returns:
+            Tuple of formatted strings, one per stat leader
+        """
+        lines = []
+        for cat, name, value, stats in key:
+            if cat in self._BASKETBALL_CATEGORIES:
+                name = self._abbreviate_display_name(name, max_length=10)
+                lines.append(f"{team_abbr} {cat}: {name} {value}")
+            else:
                 stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                lines.append(f"{team_abbr} RB: {name} {stats_short}")
-
-        return lines
+                lines.append(f"{team_abbr} {cat}: {name} {stats_short}")
+        return tuple(lines)
 
     def _format_leaders(self, team_abbr: str, leaders: Dict) -> str:
         """
         Format leader stats as a compact string (legacy method).
 
+        Returns the first line of _format_leaders_detailed so both share one
+        formatting path and its cache.
+
         Args:
             team_abbr: Team abbreviation
             leaders: Dictionary of stat leaders
 
         Returns:
-            Formatted string (e.g., "LAL: LBJ 24/8/7" or "KC: Mahomes 245 YDS")
+            Formatted string (e.g., "LAL PTS: LJ 24" or "KC QB: Mahomes 245, 2TD")
         """
-        if not leaders:
-            return ""
-
-        # Check if this is basketball or football stats
-        if 'PTS' in leaders:
-            # Basketball format: "Team: Name PTS/REB/AST"
-            pts = leaders.get('PTS', {}).get('value', 0)
-            reb = leaders.get('REB', {}).get('value', 0)
-            ast = leaders.get('AST', {}).get('value', 0)
-            name = leaders.get('PTS', {}).get('name', 'Unknown')
-
-            # Abbreviate name if too long
-            name = self._abbreviate_display_name(name, max_length=8)
-
-            return f"{team_abbr}: {name} {pts}/{reb}/{ast}"
-
-        elif 'QB' in leaders or 'WR' in leaders or 'RB' in leaders:
-            # Football format: Show top stat category
-            # Priority: QB > WR > RB
-            if 'QB' in leaders:
-                name = leaders['QB'].get('name', 'Unknown')
-                stats = leaders['QB'].get('stats', '')
-                # Simplify stats for display
-                stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                return f"{team_abbr}: {name} {stats_short}"
-            elif 'WR' in leaders:
-                name = leaders['WR'].get('name', 'Unknown')
-                stats = leaders['WR'].get('stats', '')
-                stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                return f"{team_abbr}: {name} {stats_short}"
-            elif 'RB' in leaders:
-                name = leaders['RB'].get('name', 'Unknown')
-                stats = leaders['RB'].get('stats', '')
-                stats_short = stats.replace(' YDS', '').replace(' TD', 'TD')
-                return f"{team_abbr}: {name} {stats_short}"
+        lines = self._format_leaders_detailed(team_abbr, leaders)
+        return lines[0] if lines else ""
 
-        return ""
-
-    def _abbreviate_display_name(self, name: str, max_length: int = 8) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _abbreviate_display_name(name: str, max_length: int = 8) -> str:
         """
         Abbreviate name for display if too long.
 
@@ -384,7 +658,7 @@ class StatsRenderer:
         parts = name.split()
         if len(parts) >= 2:
             # Use initials: "LeBron James" -> "LJ"
-            initials = ''.join([p[0] for p in parts[:2]])
+            initials = parts[0][:1] + parts[1][:1]
             if len(initials) <= max_length:
                 return initials
 
@@ -402,8 +676,7 @@ class StatsRenderer:
             PIL Image with error message
         """
         img = Image.new('RGB', (card_width, self.display_height), color=COLOR_BLACK)
-        draw = ImageDraw.Draw(img)
-        draw.text((2, 12), "Error", font=self.small_font, fill=COLOR_WHITE)
+        self._draw_text(img, (2, 12), "Error", 'small', COLOR_WHITE)
         return img
 
     def create_no_games_placeholder(self, width: int = 192) -> Image.Image:
@@ -416,26 +689,20 @@ class StatsRenderer:
         Returns:
             PIL Image with "No live games" message
         """
+        cached = self._placeholder_cache.get(width)
+        if cached is not None:
+            return cached.copy()
+
         img = Image.new('RGB', (width, self.display_height), color=COLOR_BLACK)
-        draw = ImageDraw.Draw(img)
 
-        message = "No live games"
         # Center the text
-        try:
-            # Try to get text dimensions for centering
-            bbox = draw.textbbox((0, 0), message, font=self.medium_font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-        except:
-            # Fallback if textbbox not available
-            text_width = len(message) * 6
-            text_height = 8
-
+        text_width, text_height = self._no_games_size
         x = (width - text_width) // 2
         y = (self.display_height - text_height) // 2
 
-        draw.text((x, y), message, font=self.medium_font, fill=COLOR_GRAY)
-        return img
+        self._draw_text(img, (x, y), NO_GAMES_MESSAGE, 'medium', COLOR_GRAY)
+        self._placeholder_cache[width] = img
+        return img.copy()
 
     def _get_team_logo(self, league: str, team_abbr: str) -> Optional[Image.Image]:
         """